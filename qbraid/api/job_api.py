@@ -15,9 +15,9 @@ Module for interacting with the qBraid Jobs API.
 import os
 import sys
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
-from .session import QbraidSession
+from .session import _get_shared_session
 
 if TYPE_CHECKING:
     import qbraid
@@ -52,10 +52,45 @@ def _qbraid_jobs_enabled():
     return False
 
 
+def _init_job_data(
+    vendor_job_id: str,
+    device: "qbraid.devices.DeviceLikeWrapper",
+    circuits: "List[qbraid.transpiler.QuantumProgramWrapper]",
+    shots: int,
+    email: Optional[str],
+) -> dict:
+    """Returns the document used to create a new qbraid job via the ``/init-job`` endpoint."""
+    # The qBraid API creates a unique Job ID, which is collected in the response.
+    # We use dummy variables for each of the status fields, which will be updated
+    # via the `get_job_data` function upon instantiation of the `JobLikeWrapper` object.
+    init_data = {
+        "qbraidJobId": "",
+        "vendorJobId": vendor_job_id,
+        "qbraidDeviceId": device.id,
+        "vendorDeviceId": device.vendor_device_id,
+        "shots": shots,
+        "createdAt": datetime.utcnow().isoformat(),
+        "status": "UNKNOWN",  # this will be set after we get back the job ID and check status
+        "qbraidStatus": "INITIALIZING",  # TODO use qbraid Enums for status values
+        "email": email,
+    }
+
+    # Circuit depth is computed once when the program wrapper is created,
+    # so reading it here does not re-traverse the circuit.
+    if len(circuits) == 1:
+        init_data["circuitNumQubits"] = circuits[0].num_qubits
+        init_data["circuitDepth"] = circuits[0].depth
+    else:
+        init_data["circuitBatchNumQubits"] = [circuit.num_qubits for circuit in circuits]
+        init_data["circuitBatchDepth"] = [circuit.depth for circuit in circuits]
+
+    return init_data
+
+
 def init_job(
     vendor_job_id: str,
     device: "qbraid.devices.DeviceLikeWrapper",
-    circuits: "qbraid.transpiler.QuantumProgramWrapper",
+    circuits: "List[qbraid.transpiler.QuantumProgramWrapper]",
     shots: int,
 ) -> str:
     """Initialize data dictionary for new qbraid job and
@@ -71,7 +106,7 @@ def init_job(
         The qbraid job ID associated with this job
 
     """
-    session = QbraidSession()
+    session = _get_shared_session()
 
     # One of the features of qBraid Quantum Jobs is the ability to send
     # jobs without any credentials using the qBraid Lab platform. If the
@@ -82,30 +117,9 @@ def init_job(
         job = session.post("/get-user-jobs", json={"vendorJobId": vendor_job_id}).json()[0]
         return job["qbraidJobId"]
 
-    # Create a new document for the user job. The qBraid API creates a unique
-    # Job ID, which is collected in the response. We use dummy variables for
-    # each of the status fields, which will be updated via the `get_job_data`
-    # function upon instantiation of the `JobLikeWrapper` object.
-    init_data = {
-        "qbraidJobId": "",
-        "vendorJobId": vendor_job_id,
-        "qbraidDeviceId": device.id,
-        "vendorDeviceId": device.vendor_device_id,
-        "shots": shots,
-        "createdAt": datetime.utcnow(),
-        "status": "UNKNOWN",  # this will be set after we get back the job ID and check status
-        "qbraidStatus": "INITIALIZING",  # TODO use qbraid Enums for status values
-        "email": os.getenv("JUPYTERHUB_USER") or session.user_email,
-    }
-
-    if len(circuits) == 1:
-        init_data["circuitNumQubits"] = circuits[0].num_qubits
-        init_data["circuitDepth"]: circuits[0].depth
-    else:
-        init_data["circuitBatchNumQubits"] = ([circuit.num_qubits for circuit in circuits],)
-        init_data["circuitBatchDepth"] = [circuit.depth for circuit in circuits]
-
-    return session.post("/init-job", data=init_data).json()
+    email = os.getenv("JUPYTERHUB_USER") or session.user_email
+    init_data = _init_job_data(vendor_job_id, device, circuits, shots, email)
+    return session.post("/init-job", json=init_data).json()
 
 
 def get_job_data(qbraid_job_id: str, update: dict = None) -> dict:
@@ -119,13 +133,13 @@ def get_job_data(qbraid_job_id: str, update: dict = None) -> dict:
         The metadata associated with this job
 
     """
-    session = QbraidSession()
+    session = _get_shared_session()
     body = {"qbraidJobId": qbraid_job_id}
     # Two status variables so we can track both qBraid and vendor status.
     if update is not None and "status" in update and "qbraidStatus" in update:
         body["status"] = update["status"]
         body["qbraidStatus"] = update["qbraidStatus"]
-    metadata = session.put("/update-job", data=body).json()[0]
+    metadata = session.put("/update-job", json=body).json()[0]
     metadata.pop("_id", None)
     metadata.pop("user", None)
     return metadata
@@ -15,7 +15,8 @@ Module for making requests to the qBraid API.
 import configparser
 import logging
 import os
-from typing import Any, Optional
+import threading
+from typing import Any, Optional, Tuple
 
 from requests import RequestException, Response, Session
 from requests.adapters import HTTPAdapter
@@ -275,3 +276,40 @@ class QbraidSession(Session):
             raise RequestsApiError(message) from ex
 
         return response
+
+
+_SHARED_SESSION: Optional[QbraidSession] = None
+_SHARED_SESSION_KEY: Optional[Tuple[Optional[Any], ...]] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _credentials_fingerprint() -> Tuple[Optional[Any], ...]:
+    """Returns a value that changes whenever any source of
+    :class:`QbraidSession` credentials (qbraidrc file or environment) changes."""
+    try:
+        config_mtime = os.stat(DEFAULT_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        config_mtime = None
+    return (
+        config_mtime,
+        os.getenv("JUPYTERHUB_USER"),
+        os.getenv("QBRAID_API_KEY"),
+        os.getenv("REFRESH"),
+    )
+
+
+def _get_shared_session() -> QbraidSession:
+    """Returns a process-wide :class:`QbraidSession` whose connection pool is reused
+    across SDK calls. The session is rebuilt whenever the qbraidrc file or the
+    credential environment variables change, so newly saved credentials are picked up.
+
+    The shared session is meant for use from the main thread; background threads
+    should create their own :class:`QbraidSession`.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_KEY  # pylint: disable=global-statement
+    key = _credentials_fingerprint()
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None or key != _SHARED_SESSION_KEY:
+            _SHARED_SESSION = QbraidSession()
+            _SHARED_SESSION_KEY = key
+        return _SHARED_SESSION
@@ -13,11 +13,13 @@ Unit tests for functions that utilize, interact with,
 or relate to qBraid other third-party APIs.
 
 """
+import json
 import os
+from unittest.mock import Mock
 
 import pytest
 
-from qbraid.api.job_api import _qbraid_jobs_enabled, _running_in_lab
+from qbraid.api.job_api import _init_job_data, _qbraid_jobs_enabled, _running_in_lab
 from qbraid.api.session import STATUS_FORCELIST, PostForcelistRetry, QbraidSession
 
 
@@ -59,3 +61,18 @@ def test_post_forcelist_retry(retry_data):
     )
     assert retry.is_retry(method, code) == should_retry
     assert retry.increment().total == init_retries - 1
+
+
+@pytest.mark.parametrize("num_circuits", [1, 2])
+def test_init_job_data(num_circuits):
+    """Test that the init-job document records circuit metadata and is JSON serializable."""
+    device = Mock(id="aws_dm_sim", vendor_device_id="dm1")
+    circuits = [Mock(num_qubits=2, depth=3) for _ in range(num_circuits)]
+    init_data = _init_job_data("vendor_id", device, circuits, 100, "test@email.com")
+    json.dumps(init_data)
+    if num_circuits == 1:
+        assert init_data["circuitNumQubits"] == 2
+        assert init_data["circuitDepth"] == 3
+    else:
+        assert init_data["circuitBatchNumQubits"] == [2, 2]
+        assert init_data["circuitBatchDepth"] == [3, 3]
@@ -0,0 +1,61 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the process-wide shared qBraid session.
+
+"""
+import configparser
+
+import pytest
+
+from qbraid.api import session as session_module
+from qbraid.api.session import _get_shared_session
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Point the qbraidrc path at an empty temporary location and reset the shared session."""
+    path = tmp_path / "qbraidrc"
+    monkeypatch.setattr(session_module, "DEFAULT_CONFIG_PATH", str(path))
+    monkeypatch.setattr(session_module, "_SHARED_SESSION", None)
+    monkeypatch.setattr(session_module, "_SHARED_SESSION_KEY", None)
+    for name in ["JUPYTERHUB_USER", "QBRAID_API_KEY", "REFRESH"]:
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+def test_shared_session_is_reused(config_path):
+    assert _get_shared_session() is _get_shared_session()
+
+
+def test_shared_session_picks_up_env_api_key(config_path, monkeypatch):
+    session = _get_shared_session()
+    assert session.api_key is None
+    monkeypatch.setenv("QBRAID_API_KEY", "new-api-key")
+    new_session = _get_shared_session()
+    assert new_session is not session
+    assert new_session.api_key == "new-api-key"
+
+
+def test_shared_session_picks_up_saved_config(config_path):
+    session = _get_shared_session()
+    assert session.api_key is None
+    config = configparser.ConfigParser()
+    config.add_section("default")
+    config.set("default", "api-key", "saved-api-key")
+    with open(config_path, "w", encoding="utf-8") as cfgfile:
+        config.write(cfgfile)
+    new_session = _get_shared_session()
+    assert new_session is not session
+    assert new_session.api_key == "saved-api-key"
+    assert new_session.headers["api-key"] == "saved-api-key"
@@ -16,47 +16,106 @@ supported by the qBraid SDK.
 
 """
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional
 
 from IPython.display import HTML, clear_output, display
 
-from .api import ApiError, QbraidSession
+from .api import ApiError
+from .api.session import QbraidSession, _get_shared_session
 from .display_utils import running_in_jupyter, update_progress_bar
 from .wrappers import device_wrapper
 
+# Results of :func:`_get_device_data` are cached per query. Within ``_CACHE_MAX_AGE``
+# seconds a cached result is served as-is; up to ``_CACHE_SWR`` seconds beyond that it
+# is still served immediately, while a background thread fetches a fresh copy.
+# :func:`refresh_devices` bumps ``_CACHE_GENERATION`` so that fetches started before
+# a refresh cannot write their (now outdated) results back into the cache.
+_CACHE_MAX_AGE = 60
+_CACHE_SWR = 3600
+_CACHE = {}
+_CACHE_GENERATION = 0
+_CACHE_LOCK = threading.Lock()
+_REVALIDATING = set()
+
+_ONLINE = "<span style='color:green'>●</span>"
+_OFFLINE = "<span style='color:red'>○</span>"
+_HEADER = (
+    "<h3>Supported Devices</h3><table><tr>"
+    "<th style='text-align:left'>Provider</th>"
+    "<th style='text-align:left'>Name</th>"
+    "<th style='text-align:left'>qBraid ID</th>"
+    "<th style='text-align:left'>Status</th></tr>"
+)
+_ROW = (
+    "<tr><td style='text-align:left'>%s</td>"
+    "<td style='text-align:left'>%s</td>"
+    "<td style='text-align:left'><code>%s</code></td>"
+    "<td>%s</td></tr>"
+)
+
+
+def _probe_device_status(qbraid_id: str) -> Optional[dict]:
+    """Returns the status update document for the given device, or None if its
+    status could not be retrieved (e.g. missing vendor credentials)."""
+    try:
+        device = device_wrapper(qbraid_id)
+        return {"qbraid_id": qbraid_id, "status": device.status.name}
+    except Exception:  # pylint: disable=broad-except
+        return None
+
 
 def refresh_devices():
     """Refreshes status for all qbraid supported devices. Requires credential for each vendor."""
+    global _CACHE_GENERATION  # pylint: disable=global-statement
 
-    session = QbraidSession()
+    session = _get_shared_session()
     devices = session.get("/public/lab/get-devices", params={}).json()
+    # None => internally not available at moment
+    to_refresh = [doc["qbraid_id"] for doc in devices if doc["statusRefresh"] is not None]
+
+    # Each status probe is an independent vendor API call, so they are run
+    # concurrently and the total refresh time is bounded by the slowest vendor.
+    # Each result is written back from this thread as soon as its probe completes.
+    # The progress bar is only drawn in Jupyter, where it is replaced by the device table.
+    show_progress = running_in_jupyter()
     count = 0
-    num_devices = len(devices)  # i.e. number of iterations
-    for document in devices:
-        progress = count / num_devices
-        update_progress_bar(progress)
-        if document["statusRefresh"] is not None:  # None => internally not available at moment
-            qbraid_id = document["qbraid_id"]
-            try:
-                device = device_wrapper(qbraid_id)
-                status = device.status.name
-                session.put("/lab/update-device", data={"qbraid_id": qbraid_id, "status": status})
-            except Exception:  # pylint: disable=broad-except
-                pass
-
-        count += 1
-    update_progress_bar(1)
-    print()
-
-
-def _get_device_data(query):
+    num_devices = len(to_refresh)  # i.e. number of iterations
+    if show_progress:
+        update_progress_bar(0)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [executor.submit(_probe_device_status, qbraid_id) for qbraid_id in to_refresh]
+        for future in as_completed(futures):
+            update = future.result()
+            if update is not None:
+                try:
+                    session.put("/lab/update-device", data=update)
+                except Exception:  # pylint: disable=broad-except
+                    pass
+            count += 1
+            if show_progress and count < num_devices:
+                update_progress_bar(count / num_devices)
+
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _CACHE.clear()
+
+    if show_progress:
+        update_progress_bar(1)
+        print()
+
+
+def _get_device_data(query, session: Optional[QbraidSession] = None):
     """Internal :func:`~qbraid.get_devices` helper function that connects with the MongoDB database
     and returns a list of devices that match the ``filter_dict`` filters. Each device is
     represented by its own length-4 list containing the device provider, name, qbraid_id,
-    and status.
+    and status. Uses the shared session unless ``session`` is given.
     """
-    session = QbraidSession()
+    session = _get_shared_session() if session is None else session
 
     # get-devices must be a POST request with kwarg `json` (not `data`) to
     # encode the query. This is because certain queries contain regular
@@ -65,33 +124,80 @@ def _get_device_data(query):
 
     if isinstance(devices, str):
         raise ApiError(devices)
-    device_data = []
-    tot_dev = 0
+    if len(devices) == 0:
+        return [], 0  # No results matching given criteria
+    # The response length is known up front, so fill a pre-sized list in place.
+    device_data = [None] * len(devices)
     min_lag = 1e7
-    for document in devices:
+    timestamp = datetime.utcnow()
+    for index, document in enumerate(devices):
         qbraid_id = document["qbraid_id"]
         name = document["name"]
         provider = document["provider"]
         status_refresh = document["statusRefresh"]
-        timestamp = datetime.utcnow()
         if status_refresh is not None:
-            format_datetime = str(status_refresh)[:10].split("-") + str(status_refresh)[
-                11:19
-            ].split(":")
-            format_datetime_int = [int(x) for x in format_datetime]
-            mk_datime = datetime(*format_datetime_int)
+            # statusRefresh is an ISO 8601 string, e.g. "2023-05-31T15:18:39.245Z"
+            mk_datime = datetime.fromisoformat(str(status_refresh)[:19])
             lag = (timestamp - mk_datime).seconds
             min_lag = min(lag, min_lag)
         status = document["status"]
-        tot_dev += 1
-        device_data.append([provider, name, qbraid_id, status])
-    if tot_dev == 0:
-        return [], 0  # No results matching given criteria
+        device_data[index] = [provider, name, qbraid_id, status]
     device_data.sort()
     lag_minutes, _ = divmod(min_lag, 60)
     return device_data, int(lag_minutes)
 
 
+def _cache_key(query: dict) -> str:
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+def _store_device_data(key, query, generation, session=None):
+    device_data, lag = _get_device_data(query, session=session)
+    with _CACHE_LOCK:
+        if generation == _CACHE_GENERATION:
+            _CACHE[key] = (time.time(), device_data, lag)
+    return device_data, lag
+
+
+def _revalidate_device_data(key, query, generation):
+    # requests.Session is not thread-safe, so the background fetch uses its own session
+    try:
+        _store_device_data(key, query, generation, session=QbraidSession())
+    except Exception:  # pylint: disable=broad-except
+        pass
+    finally:
+        with _CACHE_LOCK:
+            _REVALIDATING.discard(key)
+
+
+def _get_cached_device_data(query):
+    """Stale-while-revalidate wrapper around :func:`_get_device_data`. Returns the
+    cached device data for ``query`` when it is recent enough, scheduling a background
+    revalidation once it is older than ``_CACHE_MAX_AGE``. If there is no usable
+    cached entry, the data is fetched synchronously.
+    """
+    key = _cache_key(query)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        generation = _CACHE_GENERATION
+    if entry is not None:
+        timestamp, device_data, lag = entry
+        age = time.time() - timestamp
+        if age < _CACHE_MAX_AGE + _CACHE_SWR:
+            if age >= _CACHE_MAX_AGE:
+                with _CACHE_LOCK:
+                    start = key not in _REVALIDATING
+                    _REVALIDATING.add(key)
+                if start:
+                    threading.Thread(
+                        target=_revalidate_device_data,
+                        args=(key, query, generation),
+                        daemon=True,
+                    ).start()
+            return device_data, lag + int(age // 60)
+    return _store_device_data(key, query, generation)
+
+
 def _display_basic(data, msg):
     if len(data) == 0:
         print(msg)
@@ -108,34 +214,14 @@ def _display_jupyter(data, msg, align=None):
 
     align = "right" if align is None else align
 
-    html = """<h3>Supported Devices</h3><table><tr>
-    <th style='text-align:left'>Provider</th>
-    <th style='text-align:left'>Name</th>
-    <th style='text-align:left'>qBraid ID</th>
-    <th style='text-align:left'>Status</th></tr>
-    """
+    rows = "".join(
+        _ROW % (provider, name, qbraid_id, _ONLINE if status_str == "ONLINE" else _OFFLINE)
+        for provider, name, qbraid_id, status_str in data
+    )
 
-    online = "<span style='color:green'>●</span>"
-    offline = "<span style='color:red'>○</span>"
-
-    for provider, name, qbraid_id, status_str in data:
-        if status_str == "ONLINE":
-            status = online
-        else:
-            status = offline
+    footer = f"<tr><td colspan='4'; style='text-align:{align}'>{msg}</td></tr></table>"
 
-        html += f"""<tr>
-        <td style='text-align:left'>{provider}</td>
-        <td style='text-align:left'>{name}</td>
-        <td style='text-align:left'><code>{qbraid_id}</code></td>
-        <td>{status}</td></tr>
-        """
-
-    html += f"<tr><td colspan='4'; style='text-align:{align}'>{msg}</td></tr>"
-
-    html += "</table>"
-
-    return display(HTML(html))
+    return display(HTML(_HEADER + rows + footer))
 
 
 def get_devices(filters: Optional[dict] = None, refresh: bool = False):
@@ -195,6 +281,11 @@ def get_devices(filters: Optional[dict] = None, refresh: bool = False):
     status column, call :func:`~qbraid.get_devices` with ``refresh=True`` keyword argument.
     The bottom-right corner of the device table indicates time since the last status refresh.
 
+    Results are cached per set of filters. A cached table is shown as-is for up to a minute,
+    after which it is still shown (with its age added to the refresh time) while a fresh copy
+    is fetched in the background. Without ``refresh=True``, the displayed data can therefore
+    be up to about an hour older than the qBraid API.
+
     .. __: https://docs.mongodb.com/manual/reference/operator/query/#query-selectors
 
     Args:
@@ -205,7 +296,7 @@ def get_devices(filters: Optional[dict] = None, refresh: bool = False):
     if refresh:
         refresh_devices()
     query = {} if filters is None else filters
-    device_data, lag = _get_device_data(query)
+    device_data, lag = _get_cached_device_data(query)
 
     if len(device_data) == 0:
         align = "center"
@@ -15,7 +15,7 @@ Module for calculating unitary of quantum circuit/program
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import numpy as np
-from cirq.testing import assert_allclose_up_to_global_phase
+from cirq.linalg import allclose_up_to_global_phase
 
 from qbraid.exceptions import ProgramTypeError, QbraidError
 from qbraid.interface.convert_to_contiguous import convert_to_contiguous
@@ -110,20 +110,31 @@ def circuits_allclose(
         stric_gphase: If False, disregards global phase when verifying
             equivalance of the input circuit's unitaries.
 
+    Keyword Args:
+        rtol (float): Relative tolerance of the global-phase-insensitive check. Defaults to 1e-7.
+        atol (float): Absolute tolerance of the global-phase-insensitive check. Defaults to 1e-7.
+        equal_nan (bool): Whether to compare NaN entries as equal. Defaults to True.
+        err_msg, verbose: Accepted for backwards compatibility and ignored.
+
     Returns:
         True if the input circuits pass unitary equality check
 
     """
     unitary0 = to_unitary(circuit0, ensure_contiguous=index_contig)
     unitary1 = to_unitary(circuit1, ensure_contiguous=index_contig)
+    if unitary0.shape != unitary1.shape:
+        return False
     if strict_gphase:
         return np.allclose(unitary0, unitary1)
-    try:
-        atol = kwargs.pop("atol", None) or 1e-7
-        assert_allclose_up_to_global_phase(unitary0, unitary1, atol=atol, **kwargs)
-    except AssertionError:
-        return False
-    return True
+    atol = kwargs.pop("atol", 1e-7)
+    rtol = kwargs.pop("rtol", 1e-7)
+    equal_nan = kwargs.pop("equal_nan", True)
+    # Reporting options of the former assertion-based check; no longer used.
+    kwargs.pop("err_msg", None)
+    kwargs.pop("verbose", None)
+    return allclose_up_to_global_phase(
+        unitary0, unitary1, rtol=rtol, atol=atol, equal_nan=equal_nan, **kwargs
+    )
 
 
 def unitary_to_little_endian(matrix: np.ndarray) -> np.ndarray:
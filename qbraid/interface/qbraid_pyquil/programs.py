@@ -11,13 +11,21 @@
 Module containing pyQuil programs used for testing
 
 """
+from functools import lru_cache
+
 from pyquil import Program
 from pyquil.gates import CNOT, H
 
 
-def pyquil_bell() -> Program:
-    """Returns pyQuil bell circuit"""
+@lru_cache(maxsize=1)
+def _pyquil_bell() -> Program:
     program = Program()
     program += H(1)
     program += CNOT(1, 0)
     return program
+
+
+def pyquil_bell() -> Program:
+    """Returns pyQuil bell circuit"""
+    # Programs are mutable, so hand out a copy of the cached instance.
+    return _pyquil_bell().copy()
@@ -21,6 +21,7 @@ from pytket.circuit import Circuit as TKCircuit
 
 from qbraid.exceptions import ProgramTypeError
 from qbraid.interface.calculate_unitary import (
+    circuits_allclose,
     random_unitary_matrix,
     to_unitary,
     unitary_to_little_endian,
@@ -132,3 +133,11 @@ def test_unitary_raises():
 def test_random_unitary():
     matrix = random_unitary_matrix(2)
     assert np.allclose(matrix @ matrix.conj().T, np.eye(2))
+
+
+def test_circuits_allclose_shape_mismatch():
+    """Test that circuits acting on different numbers of qubits are not allclose."""
+    circuit0 = Circuit().h(0)
+    circuit1 = Circuit().h(0).i(1)
+    assert not circuits_allclose(circuit0, circuit1)
+    assert not circuits_allclose(circuit0, circuit1, strict_gphase=True)
@@ -12,8 +12,10 @@
 Unit tests for qbraid top-level functionality
 
 """
+import importlib
 import os
 import sys
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -27,6 +29,10 @@ from qbraid.get_jobs import _display_jobs_jupyter, get_jobs
 
 # pylint: disable=missing-function-docstring,redefined-outer-name
 
+# ``qbraid.get_devices`` resolves to the function re-exported by ``qbraid``,
+# so look up the module itself to patch its internals.
+get_devices_module = importlib.import_module("qbraid.get_devices")
+
 # Skip tests if IBM/AWS account auth/creds not configured
 skip_remote_tests: bool = os.getenv("QBRAID_RUN_REMOTE_TESTS") is None
 REASON = "QBRAID_RUN_REMOTE_TESTS not set (requires configuration of qBraid/AWS/IBM storage)"
@@ -207,21 +213,20 @@ def test_get_devices_results(capfd):
 @pytest.mark.skipif(skip_remote_tests, reason=REASON)
 def test_get_devices_refresh_results(capfd):
     """Test ``get_devices`` stdout for results > 0, with refresh.
-    When results returned, output format is as follows:
-    (1) Progress bar
-    (2) Empty line
-    (3) Message
-    (4) Empty line
-    (5) Section titles
-    (6) Underline titles
-    (7+x) ``x`` lines of results
-
-    So for a query returning ``x`` results, we expect ``6+x`` total lines from stdout.
+    Outside of Jupyter no refresh progress bar is drawn, so the output format
+    is the same as without refresh:
+    (1) Message
+    (2) Section titles
+    (3) Underline titles
+    (4+x) ``x`` lines of results
+    (5+x) Empty line
+
+    So for a query returning ``x`` results, we expect ``5+x`` total lines from stdout.
     """
     _mock_ipython(MockIPython(None))
     get_devices(filters={"qbraid_id": "ibm_q_belem"}, refresh=True)
     num_results = 1  # searching by device id will return one result
-    lines_expected = 7 + num_results
+    lines_expected = 5 + num_results
     out, err = capfd.readouterr()
     lines_out = len(out.split("\n"))
     assert lines_out == lines_expected
@@ -236,6 +241,115 @@ def test_get_devices_in_jupyter(capfd):
     assert len(err) == 0
 
 
+def test_get_devices_cached_result(monkeypatch):
+    """Test that repeated device queries within the cache max-age are served
+    from the cache without calling the qBraid API again."""
+    device_data = [["IBM", "Belem", "ibm_q_belem", "ONLINE"]]
+    mock_get_device_data = Mock(return_value=(device_data, 5))
+    monkeypatch.setattr(get_devices_module, "_get_device_data", mock_get_device_data)
+    monkeypatch.setattr(get_devices_module, "_CACHE", {})
+    query = {"qbraid_id": "ibm_q_belem"}
+    assert get_devices_module._get_cached_device_data(query) == (device_data, 5)
+    assert get_devices_module._get_cached_device_data(dict(query)) == (device_data, 5)
+    mock_get_device_data.assert_called_once_with(query, session=None)
+
+
+@pytest.fixture
+def device_cache(monkeypatch):
+    """Empty device cache with the device API mocked out."""
+    device_data = [["IBM", "Belem", "ibm_q_belem", "ONLINE"]]
+    mock_get_device_data = Mock(return_value=(device_data, 5))
+    monkeypatch.setattr(get_devices_module, "_get_device_data", mock_get_device_data)
+    monkeypatch.setattr(get_devices_module, "_CACHE", {})
+    monkeypatch.setattr(get_devices_module, "_REVALIDATING", set())
+    monkeypatch.setattr(get_devices_module, "_CACHE_GENERATION", 0)
+    return mock_get_device_data
+
+
+def _cache_entry(query, age, device_data, lag):
+    key = get_devices_module._cache_key(query)
+    get_devices_module._CACHE[key] = (time.time() - age, device_data, lag)
+    return key
+
+
+def test_get_devices_stale_result_revalidates_once(monkeypatch, device_cache):
+    """Test that a stale cached result is served with its age added to the lag,
+    and that only one background revalidation is started for it."""
+    mock_thread = Mock()
+    monkeypatch.setattr(get_devices_module.threading, "Thread", mock_thread)
+    query = {"qbraid_id": "ibm_q_belem"}
+    stale_data = [["IBM", "Belem", "ibm_q_belem", "OFFLINE"]]
+    key = _cache_entry(query, 125, stale_data, 3)
+    assert get_devices_module._get_cached_device_data(query) == (stale_data, 5)
+    assert get_devices_module._get_cached_device_data(query) == (stale_data, 5)
+    mock_thread.assert_called_once()
+    assert mock_thread.call_args.kwargs["args"] == (key, query, 0)
+    assert key in get_devices_module._REVALIDATING
+    device_cache.assert_not_called()
+
+
+def test_get_devices_revalidate_result(monkeypatch, device_cache):
+    """Test that a background revalidation stores the fresh result using its own session."""
+    mock_session = Mock()
+    monkeypatch.setattr(get_devices_module, "QbraidSession", Mock(return_value=mock_session))
+    query = {"qbraid_id": "ibm_q_belem"}
+    key = get_devices_module._cache_key(query)
+    get_devices_module._REVALIDATING.add(key)
+    get_devices_module._revalidate_device_data(key, query, 0)
+    device_cache.assert_called_once_with(query, session=mock_session)
+    assert get_devices_module._CACHE[key][1:] == device_cache.return_value
+    assert key not in get_devices_module._REVALIDATING
+
+
+def test_get_devices_expired_result(device_cache):
+    """Test that a cached result older than max-age plus stale-while-revalidate
+    window is replaced by a synchronous fetch."""
+    query = {"qbraid_id": "ibm_q_belem"}
+    age = get_devices_module._CACHE_MAX_AGE + get_devices_module._CACHE_SWR + 1
+    _cache_entry(query, age, [], 0)
+    assert get_devices_module._get_cached_device_data(query) == device_cache.return_value
+    device_cache.assert_called_once_with(query, session=None)
+
+
+def test_refresh_devices_clears_cache(monkeypatch, device_cache):
+    """Test that refreshing device statuses invalidates cached device data, and that
+    results fetched before the refresh are not written back to the cache."""
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = []
+    monkeypatch.setattr(get_devices_module, "_get_shared_session", Mock(return_value=mock_session))
+    query = {"qbraid_id": "ibm_q_belem"}
+    key = _cache_entry(query, 0, [], 0)
+    get_devices_module.refresh_devices()
+    assert not get_devices_module._CACHE
+    assert get_devices_module._CACHE_GENERATION == 1
+    get_devices_module._store_device_data(key, query, 0)
+    assert not get_devices_module._CACHE
+
+
+def test_display_devices_jupyter(monkeypatch):
+    """Test that the devices table is rendered with a row per device and inline cell styles."""
+    mock_display = Mock()
+    monkeypatch.setattr(get_devices_module, "display", mock_display)
+    monkeypatch.setattr(get_devices_module, "clear_output", Mock())
+    data = [
+        ["IBM", "Belem", "ibm_q_belem", "ONLINE"],
+        ["IonQ", "Harmony", "aws_ionq_harmony", "OFFLINE"],
+    ]
+    get_devices_module._display_jupyter(data, "Device status updated 0 minutes ago")
+    html = mock_display.call_args[0][0].data
+    assert "<style>" not in html
+    assert (
+        "<tr><td style='text-align:left'>IBM</td><td style='text-align:left'>Belem</td>"
+        "<td style='text-align:left'><code>ibm_q_belem</code></td>"
+        "<td><span style='color:green'>●</span></td></tr>"
+    ) in html
+    assert "<code>aws_ionq_harmony</code></td><td><span style='color:red'>○</span>" in html
+    assert html.endswith(
+        "<tr><td colspan='4'; style='text-align:right'>"
+        "Device status updated 0 minutes ago</td></tr></table>"
+    )
+
+
 def get_ipython():
     pass
 
@@ -103,12 +103,13 @@ def test_from_braket_three_qubit_gates():
     assert circuits_allclose(braket_circuit, cirq_circuit, strict_gphase=True)
 
 
+_COS_PI_7, _SIN_PI_7 = np.cos(np.pi / 7), np.sin(np.pi / 7)
+_ROTATION_PI_7 = np.array([[_COS_PI_7, _SIN_PI_7], [-_SIN_PI_7, _COS_PI_7]])
+
+
 def _rotation_of_pi_over_7(num_qubits):
-    matrix = np.identity(2**num_qubits)
-    matrix[0:2, 0:2] = [
-        [np.cos(np.pi / 7), np.sin(np.pi / 7)],
-        [-np.sin(np.pi / 7), np.cos(np.pi / 7)],
-    ]
+    matrix = np.eye(2**num_qubits)
+    matrix[0:2, 0:2] = _ROTATION_PI_7
     return matrix
 
 
@@ -23,6 +23,8 @@ from cirq import Circuit, LineQubit, ops, testing
 from qbraid.interface import circuits_allclose, random_unitary_matrix
 from qbraid.transpiler.cirq_braket.convert_to_braket import to_braket
 
+_ANGLES = np.random.default_rng(11).random(4)
+
 
 @pytest.mark.parametrize("qreg", (LineQubit.range(2), [LineQubit(1), LineQubit(6)]))
 def test_to_braket_bell_circuit(qreg):
@@ -56,7 +58,7 @@ def test_to_braket_non_parameterized_single_qubit_gates():
 def test_to_braket_parameterized_single_qubit_gates(qubit_index):
     """Testing converting circuit containing parameterized single-qubit gates"""
     qubit = LineQubit(qubit_index)
-    angles = np.random.RandomState(11).random(4)  # pylint: disable=no-member
+    angles = _ANGLES
     cirq_circuit = Circuit(
         ops.rx(angles[0]).on(qubit),
         ops.ry(angles[1]).on(qubit),
@@ -185,18 +187,16 @@ def test_to_braket_common_three_qubit_gates(common_gate):
 
 
 @pytest.mark.parametrize("num_qubits", [1, 2, 3, 4, 5])
-def test_50_random_circuits(num_qubits):
+@pytest.mark.parametrize("i", range(10))
+def test_50_random_circuits(num_qubits, i):
     """Testing converting 50 random circuits"""
-    for i in range(10):
-        moments = np.random.randint(1, 6)
-        state = num_qubits + i
-        cirq_circuit = testing.random_circuit(
-            num_qubits, n_moments=moments, op_density=1, random_state=state
-        )
-        braket_circuit = to_braket(cirq_circuit)
-        if not circuits_allclose(braket_circuit, cirq_circuit, strict_gphase=True):
-            assert False
-    assert True
+    moments = np.random.randint(1, 6)
+    state = num_qubits + i
+    cirq_circuit = testing.random_circuit(
+        num_qubits, n_moments=moments, op_density=1, random_state=state
+    )
+    braket_circuit = to_braket(cirq_circuit)
+    assert circuits_allclose(braket_circuit, cirq_circuit, strict_gphase=True)
 
 
 @pytest.mark.parametrize(
@@ -235,19 +235,19 @@ class QasmParser:
         ),
         'u2': QasmGateStatement(
             qasm_gate='u2',
-            cirq_gate=(lambda params: qbraid_cirq_gates.U2Gate(*params)),
+            cirq_gate=(lambda params: qbraid_cirq_gates.u2(*params)),
             num_params=2,
             num_args=1,
         ),
         'u3': QasmGateStatement(
             qasm_gate='u3',
-            cirq_gate=(lambda params: qbraid_cirq_gates.U3Gate(*params)),
+            cirq_gate=(lambda params: qbraid_cirq_gates.u3(*params)),
             num_params=3,
             num_args=1,
         ),
         'u': QasmGateStatement(
             qasm_gate='u',
-            cirq_gate=(lambda params: qbraid_cirq_gates.U3Gate(*params)),
+            cirq_gate=(lambda params: qbraid_cirq_gates.u3(*params)),
             num_params=3,
             num_args=1,
         ),
@@ -316,13 +316,13 @@ class QasmParser:
         ),
         'cu3': QasmGateStatement(
             qasm_gate='cu3',
-            cirq_gate=(lambda params: ops.ControlledGate(qbraid_cirq_gates.U3Gate(*params))),
+            cirq_gate=(lambda params: ops.ControlledGate(qbraid_cirq_gates.u3(*params))),
             num_params=3,
             num_args=2,
         ),
         'cu': QasmGateStatement(
             qasm_gate='cu',
-            cirq_gate=(lambda params: ops.ControlledGate(qbraid_cirq_gates.U3Gate(*params))),
+            cirq_gate=(lambda params: ops.ControlledGate(qbraid_cirq_gates.u3(*params))),
             num_params=3,
             num_args=2,
         ),
@@ -15,8 +15,11 @@ Module for Cirq custom gates to aid the transpiler and qasm parser
 
 """
 
+import cmath
 import fractions
-from typing import Optional, Tuple
+import math
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import cirq
 import numpy as np
@@ -32,35 +35,58 @@ from cirq import (
     value,
 )
 
+_ISQRT2 = 1.0 / math.sqrt(2.0)
+
+
+def _apply_single_qubit_matrix(matrix: np.ndarray, args: "cirq.ApplyUnitaryArgs") -> np.ndarray:
+    """Applies a 2x2 ``matrix`` to the target axis of ``args.target_tensor``, writing the
+    result into ``args.available_buffer``."""
+    # The trailing Ellipsis keeps the slices as views even for a one-qubit state.
+    zero = args.subspace_index(0) + (Ellipsis,)
+    one = args.subspace_index(1) + (Ellipsis,)
+    amp0 = args.target_tensor[zero]
+    amp1 = args.target_tensor[one]
+    out0 = args.available_buffer[zero]
+    out1 = args.available_buffer[one]
+    np.multiply(amp0, matrix[0, 0], out=out0)
+    out0 += matrix[0, 1] * amp1
+    np.multiply(amp0, matrix[1, 0], out=out1)
+    out1 += matrix[1, 1] * amp1
+    return args.available_buffer
+
 
 class U2Gate(Gate):
     """A single qubit gate for rotations about the
     X+Z axis of the Bloch sphere.
     """
 
+    __slots__ = ("_phi", "_lam", "_matrix")
+
     def __init__(self, phi, lam):
         self._phi = float(phi)
         self._lam = float(lam)
 
-        super()
+        phi = self._phi
+        lam = self._lam
+
+        # The gate is immutable, so its unitary is computed once here.
+        self._matrix = np.empty((2, 2), dtype=np.complex128)
+        self._matrix[0, 0] = _ISQRT2
+        self._matrix[0, 1] = -np.exp(1j * lam) * _ISQRT2
+        self._matrix[1, 0] = np.exp(1j * phi) * _ISQRT2
+        self._matrix[1, 1] = np.exp(1j * (phi + lam)) * _ISQRT2
 
     def _num_qubits_(self) -> int:
         return 1
 
+    def _has_unitary_(self) -> bool:
+        return True
+
     def _unitary_(self):
-        isqrt2 = 1 / np.sqrt(2)
-        phi = self._phi
-        lam = self._lam
+        return np.copy(self._matrix)
 
-        return np.array(
-            [
-                [isqrt2, -np.exp(1j * lam) * isqrt2],
-                [
-                    np.exp(1j * phi) * isqrt2,
-                    np.exp(1j * (phi + lam)) * isqrt2,
-                ],
-            ],
-        )
+    def _apply_unitary_(self, args: "cirq.ApplyUnitaryArgs") -> np.ndarray:
+        return _apply_single_qubit_matrix(self._matrix, args)
 
     def _circuit_diagram_info_(self, args):
         cirq_phi = self._phi / np.pi
@@ -80,31 +106,37 @@ class U3Gate(Gate):
     given 3 Euler angles.
     """
 
+    __slots__ = ("_theta", "_phi", "_lam", "_matrix")
+
     def __init__(self, theta, phi, lam):
         self._theta = float(theta)
         self._phi = float(phi)
         self._lam = float(lam)
 
-        super()
+        # Scalar math/cmath calls avoid NumPy ufunc dispatch for single values.
+        cos = math.cos(self._theta / 2)
+        sin = math.sin(self._theta / 2)
+        exp_phi = cmath.exp(1j * self._phi)
+        exp_lam = cmath.exp(1j * self._lam)
+
+        # The gate is immutable, so its unitary is computed once here.
+        self._matrix = np.empty((2, 2), dtype=np.complex128)
+        self._matrix[0, 0] = cos
+        self._matrix[0, 1] = -exp_lam * sin
+        self._matrix[1, 0] = exp_phi * sin
+        self._matrix[1, 1] = exp_phi * exp_lam * cos
 
     def _num_qubits_(self) -> int:
         return 1
 
+    def _has_unitary_(self) -> bool:
+        return True
+
     def _unitary_(self):
-        cos = np.cos(self._theta / 2)
-        sin = np.sin(self._theta / 2)
-        phi = self._phi
-        lam = self._lam
+        return np.copy(self._matrix)
 
-        return np.array(
-            [
-                [cos, -np.exp(complex(0, lam)) * sin],
-                [
-                    np.exp(complex(0, phi)) * sin,
-                    np.exp(complex(0, phi + lam)) * cos,
-                ],
-            ]
-        )
+    def _apply_unitary_(self, args: "cirq.ApplyUnitaryArgs") -> np.ndarray:
+        return _apply_single_qubit_matrix(self._matrix, args)
 
     def _circuit_diagram_info_(self, args):
         cirq_theta = self._theta / np.pi
@@ -124,32 +156,59 @@ class U3Gate(Gate):
 class RZZGate(Gate):
     """A two qubit gate for rotations about ZZ."""
 
-    def __init__(self, theta):
+    __slots__ = ("_theta", "_diag")
+
+    def __init__(self, theta, diag: Optional[np.ndarray] = None):
         self._theta = float(theta)
 
-        super()
+        # The unitary is diagonal with only two distinct phases, e^{-iθ/2} and e^{iθ/2},
+        # so only the diagonal is stored. It may be given precomputed, see :func:`rzz_layer`.
+        if diag is not None:
+            self._diag = np.asarray(diag, dtype=np.complex128)
+        else:
+            itheta2 = 1j * self._theta / 2
+            e_neg = np.exp(-itheta2)
+            e_pos = np.exp(itheta2)
+            self._diag = np.empty(4, dtype=np.complex128)
+            self._diag[0] = self._diag[3] = e_neg
+            self._diag[1] = self._diag[2] = e_pos
 
     def _num_qubits_(self) -> int:
         return 2
 
+    def _has_unitary_(self) -> bool:
+        return True
+
     def _unitary_(self):
-        itheta2 = 1j * float(self._theta) / 2
-        return np.array(
-            [
-                [np.exp(-itheta2), 0, 0, 0],
-                [0, np.exp(itheta2), 0, 0],
-                [0, 0, np.exp(itheta2), 0],
-                [0, 0, 0, np.exp(-itheta2)],
-            ],
-        )
+        return np.diag(self._diag)
+
+    def _apply_unitary_(self, args: "cirq.ApplyUnitaryArgs") -> np.ndarray:
+        # Scale each computational basis subspace by its phase instead of a dense matmul.
+        for index, phase in enumerate(self._diag):
+            args.target_tensor[args.subspace_index(big_endian_bits_int=index)] *= phase
+        return args.target_tensor
 
     def _circuit_diagram_info_(self, args):
-        theta_radians = self._theta / np.pi
-        rounded_theta = np.array(theta_radians)
-        if args.precision is not None:
-            rounded_theta = rounded_theta.round(args.precision)
-        gate_str = f"RZZ({rounded_theta})"
-        return CircuitDiagramInfo((gate_str, gate_str))
+        return _rzz_diagram_info(self._theta, args.precision)
+
+
+@lru_cache(maxsize=1024)
+def _rzz_diagram_info(theta: float, precision: Optional[int]) -> CircuitDiagramInfo:
+    theta_radians = theta / np.pi
+    if precision is not None:
+        theta_radians = round(theta_radians, precision)
+    gate_str = f"RZZ({theta_radians})"
+    return CircuitDiagramInfo((gate_str, gate_str))
+
+
+# QASM templates for the ZPowGate exponents that have a named gate (with zero global shift).
+_QASM_SHIFT0_TABLE = {
+    0.25: "t {0};\n",
+    -0.25: "tdg {0};\n",
+    0.5: "s {0};\n",
+    -0.5: "sdg {0};\n",
+    1: "z {0};\n",
+}
 
 
 @value.value_equality
@@ -158,21 +217,36 @@ class ZPowGate(cirq.ZPowGate):
     Z axis of the Bloch sphere.
     """
 
+    def __init__(self, *, exponent=1.0, global_shift=0.0, dimension=2):
+        super().__init__(exponent=exponent, global_shift=global_shift, dimension=dimension)
+        # QASM half-turns strings of a numeric exponent, keyed by output precision.
+        self._half_turns_strs = {} if isinstance(self._exponent, (float, int)) else None
+
+    def _half_turns(self, precision: int) -> str:
+        """Returns the exponent as rendered by the ``half_turns`` spec of :class:`cirq.QasmArgs`."""
+        half_turns = self._half_turns_strs.get(precision)
+        if half_turns is None:
+            exponent = self._exponent
+            if isinstance(exponent, float):
+                exponent = round(exponent, precision)
+            half_turns = f"pi*{exponent}" if exponent != 0 else "0"
+            self._half_turns_strs[precision] = half_turns
+        return half_turns
+
     def _qasm_(self, args: "cirq.QasmArgs", qubits: Tuple["cirq.Qid", ...]) -> Optional[str]:
         args.validate_version("2.0")
+        if self._half_turns_strs is None:
+            # Symbolic exponents are left to the QasmArgs formatter.
+            if self._global_shift == 0:
+                return args.format("p({0:half_turns}) {1};\n", self._exponent, qubits[0])
+            return args.format("rz({0:half_turns}) {1};\n", self._exponent, qubits[0])
+        qubit = args.qubit_id_map[qubits[0]]
         if self._global_shift == 0:
-            if self._exponent == 0.25:
-                return args.format("t {0};\n", qubits[0])
-            if self._exponent == -0.25:
-                return args.format("tdg {0};\n", qubits[0])
-            if self._exponent == 0.5:
-                return args.format("s {0};\n", qubits[0])
-            if self._exponent == -0.5:
-                return args.format("sdg {0};\n", qubits[0])
-            if self._exponent == 1:
-                return args.format("z {0};\n", qubits[0])
-            return args.format("p({0:half_turns}) {1};\n", self._exponent, qubits[0])
-        return args.format("rz({0:half_turns}) {1};\n", self._exponent, qubits[0])
+            template = _QASM_SHIFT0_TABLE.get(self._exponent)
+            if template is not None:
+                return template.format(qubit)
+            return f"p({self._half_turns(args.precision)}) {qubit};\n"
+        return f"rz({self._half_turns(args.precision)}) {qubit};\n"
 
 
 def _give_cirq_gate_name(gate: Gate, name: str, n_qubits: int) -> Gate:
@@ -190,15 +264,92 @@ def matrix_gate(matrix: np.ndarray) -> MatrixGate:
     return unitary_gate
 
 
-def rzz(theta):
-    """Returns custom cirq RZZ gate given rotation angle"""
-    if theta == 0:
-        return IdentityGate(2)
-    if theta == 2 * np.pi:
-        return TwoQubitDiagonalGate([np.pi] * 4)
+def u3_matrices(thetas, phis, lams) -> np.ndarray:
+    """Returns the U3 unitaries for arrays of Euler angles as an array of shape ``(N, 2, 2)``,
+    computed with one vectorized NumPy call per matrix entry."""
+    thetas, phis, lams = np.broadcast_arrays(
+        *(np.asarray(angles, dtype=float).ravel() for angles in (thetas, phis, lams))
+    )
+    cos = np.cos(thetas / 2)
+    sin = np.sin(thetas / 2)
+    exp_phi = np.exp(1j * phis)
+    exp_lam = np.exp(1j * lams)
+    matrices = np.empty((len(thetas), 2, 2), dtype=np.complex128)
+    matrices[:, 0, 0] = cos
+    matrices[:, 0, 1] = -exp_lam * sin
+    matrices[:, 1, 0] = exp_phi * sin
+    matrices[:, 1, 1] = exp_phi * exp_lam * cos
+    return matrices
+
+
+@lru_cache(maxsize=16384)
+def _u2_cached(phi: float, lam: float) -> U2Gate:
+    return U2Gate(phi, lam)
+
+
+@lru_cache(maxsize=16384)
+def _u3_cached(theta: float, phi: float, lam: float) -> U3Gate:
+    return U3Gate(theta, phi, lam)
+
+
+def u2(phi, lam) -> U2Gate:
+    """Returns custom cirq U2 gate given rotation angles. Gates are shared between calls
+    with the same angles (to 12 decimal places)."""
+    return _u2_cached(round(float(phi), 12), round(float(lam), 12))
+
+
+def u3(theta, phi, lam) -> U3Gate:
+    """Returns custom cirq U3 gate given Euler angles. Gates are shared between calls
+    with the same angles (to 12 decimal places)."""
+    return _u3_cached(round(float(theta), 12), round(float(phi), 12), round(float(lam), 12))
+
+
+_IDENTITY2 = IdentityGate(2)
+_NEG_IDENTITY2 = TwoQubitDiagonalGate([np.pi] * 4)
+
+
+@lru_cache(maxsize=4096)
+def _rzz_cached(theta: float) -> Gate:
+    # RZZ has period 4π: it is the identity at multiples of 4π and -I half-way between.
+    turns = theta % (4 * np.pi)
+    if math.isclose(turns, 0, abs_tol=1e-12) or math.isclose(turns, 4 * np.pi, abs_tol=1e-12):
+        return _IDENTITY2
+    if math.isclose(turns, 2 * np.pi, abs_tol=1e-12):
+        return _NEG_IDENTITY2
     return RZZGate(theta)
 
 
+def rzz(theta):
+    """Returns custom cirq RZZ gate given rotation angle. Gates are shared between calls
+    with the same angle (to 12 decimal places)."""
+    return _rzz_cached(round(float(theta), 12))
+
+
+_RZZ_HALF_SIGNS = np.array([-0.5, 0.5, 0.5, -0.5])
+
+
+def rzz_layer(thetas) -> List[Gate]:
+    """Returns custom cirq RZZ gates for a sequence of rotation angles, e.g. one layer of
+    an ansatz. The gates are equal to ``[rzz(theta) for theta in thetas]``, but the special
+    angles and the phases of all gates are computed with single vectorized operations."""
+    thetas = np.round(np.asarray(thetas, dtype=float).ravel(), 12)
+    turns = np.mod(thetas, 4 * np.pi)
+    identity = np.isclose(turns, 0, rtol=0, atol=1e-12)
+    identity |= np.isclose(turns, 4 * np.pi, rtol=0, atol=1e-12)
+    negative = np.isclose(turns, 2 * np.pi, rtol=0, atol=1e-12)
+    diags = np.exp(1j * thetas[:, None] * _RZZ_HALF_SIGNS)
+
+    gates = []
+    for theta, diag, is_identity, is_negative in zip(thetas, diags, identity, negative):
+        if is_identity:
+            gates.append(_IDENTITY2)
+        elif is_negative:
+            gates.append(_NEG_IDENTITY2)
+        else:
+            gates.append(RZZGate(theta, diag=diag))
+    return gates
+
+
 def _map_zpow(op: Operation, _: int) -> OP_TREE:
     if isinstance(op.gate, cirq.ZPowGate):
         yield ZPowGate(exponent=op.gate.exponent, global_shift=op.gate.global_shift)(op.qubits[0])
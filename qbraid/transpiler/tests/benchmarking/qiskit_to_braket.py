@@ -12,18 +12,25 @@
 Benchmarking accuracy of qiskit to braket conversions
 
 """
+import cirq
 import qiskit
 import qiskit_braket_provider
 
 import qbraid
+from qbraid.interface import to_unitary
 from qbraid.interface.qbraid_qiskit.gates import get_qiskit_gates
 
 
-def execute_test(conversion_function, qiskit_circuit):
+def execute_test(conversion_function, qiskit_circuit, qiskit_unitary):
+    """Returns 1 if ``conversion_function`` fails to produce a braket circuit whose
+    unitary matches ``qiskit_unitary`` up to global phase, otherwise returns 0."""
+    if qiskit_unitary is None:
+        return 1
     try:
         braket_circuit = conversion_function(qiskit_circuit)
-        if not qbraid.interface.circuits_allclose(
-            qiskit_circuit, braket_circuit, strict_gphase=False
+        braket_unitary = to_unitary(braket_circuit, ensure_contiguous=True)
+        if not cirq.allclose_up_to_global_phase(
+            qiskit_unitary, braket_unitary, rtol=1e-7, atol=1e-7
         ):
             return 1
     except Exception:
@@ -38,11 +45,21 @@ for gate_name, gate in qiskit_gates.items():
     qiskit_circuit = qiskit.QuantumCircuit(gate.num_qubits)
     qiskit_circuit.compose(gate, inplace=True)
 
+    # The reference unitary is shared by both conversion paths, so compute it once per gate.
+    try:
+        qiskit_unitary = to_unitary(qiskit_circuit, ensure_contiguous=True)
+    except Exception:
+        qiskit_unitary = None
+
     qiskit_failed += execute_test(
-        qiskit_braket_provider.providers.adapter.convert_qiskit_to_braket_circuit, qiskit_circuit
+        qiskit_braket_provider.providers.adapter.convert_qiskit_to_braket_circuit,
+        qiskit_circuit,
+        qiskit_unitary,
     )
     qbraid_failed += execute_test(
-        lambda circuit: qbraid.circuit_wrapper(circuit).transpile("braket"), qiskit_circuit
+        lambda circuit: qbraid.circuit_wrapper(circuit).transpile("braket"),
+        qiskit_circuit,
+        qiskit_unitary,
     )
 
 total_tests = len(qiskit_gates)
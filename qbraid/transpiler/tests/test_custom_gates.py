@@ -0,0 +1,213 @@
+# Copyright (C) 2023 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the Cirq custom gates used by the transpiler and qasm parser.
+
+"""
+import copy
+import pickle
+
+import cirq
+import numpy as np
+import pytest
+
+from qbraid.transpiler.custom_gates import (
+    RZZGate,
+    U2Gate,
+    U3Gate,
+    ZPowGate,
+    rzz,
+    rzz_layer,
+    u2,
+    u3,
+    u3_matrices,
+)
+
+# pylint: disable=missing-function-docstring
+
+
+def _u3_matrix(theta, phi, lam):
+    cos, sin = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array(
+        [
+            [cos, -np.exp(1j * lam) * sin],
+            [np.exp(1j * phi) * sin, np.exp(1j * (phi + lam)) * cos],
+        ]
+    )
+
+
+def _rzz_matrix(theta):
+    return np.diag(np.exp(1j * theta / 2 * np.array([-1, 1, 1, -1])))
+
+
+@pytest.mark.parametrize("params", [(0.0, 0.0, 0.0), (np.pi, 2.3, 3.0), (3.14, -np.pi, 8.0)])
+def test_u3_unitary(params):
+    assert np.allclose(cirq.unitary(U3Gate(*params)), _u3_matrix(*params))
+
+
+@pytest.mark.parametrize("params", [(0.0, 0.0), (2.0 * np.pi, np.pi / 3.0), (-1.2, 0.7)])
+def test_u2_unitary(params):
+    assert np.allclose(cirq.unitary(U2Gate(*params)), _u3_matrix(np.pi / 2, *params))
+
+
+@pytest.mark.parametrize("theta", [0.0, 0.3, np.pi, -2.5])
+def test_rzz_unitary(theta):
+    assert np.allclose(cirq.unitary(RZZGate(theta)), _rzz_matrix(theta))
+
+
+@pytest.mark.parametrize("gate", [U2Gate(0.1, 0.2), U3Gate(0.1, 0.2, 0.3), RZZGate(0.4)])
+def test_unitary_is_not_shared(gate):
+    """Test that mutating a returned unitary does not affect the gate."""
+    expected = cirq.unitary(gate)
+    cirq.unitary(gate)[0, 0] = 0
+    assert np.array_equal(cirq.unitary(gate), expected)
+
+
+@pytest.mark.parametrize("theta", [0, 4 * np.pi, -4 * np.pi, 8 * np.pi + 1e-13])
+def test_rzz_identity(theta):
+    assert rzz(theta) == cirq.IdentityGate(2)
+
+
+@pytest.mark.parametrize("theta", [2 * np.pi, -2 * np.pi, 6 * np.pi])
+def test_rzz_negative_identity(theta):
+    gate = rzz(theta)
+    assert isinstance(gate, cirq.TwoQubitDiagonalGate)
+    assert np.allclose(cirq.unitary(gate), _rzz_matrix(theta))
+
+
+def test_rzz_gate_reused():
+    gate = rzz(0.3)
+    assert isinstance(gate, RZZGate)
+    assert rzz(np.float64(0.3)) is gate
+    assert np.allclose(cirq.unitary(gate), _rzz_matrix(0.3))
+
+
+def _apply_unitary(gate, axes):
+    rng = np.random.default_rng(7)
+    state = rng.random((2, 2, 2)) + 1j * rng.random((2, 2, 2))
+    args = cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), axes)
+    return state, gate._apply_unitary_(args)
+
+
+@pytest.mark.parametrize("axes", [(0, 2), (2, 1)])
+@pytest.mark.parametrize("theta", [0.3, -2.5])
+def test_rzz_apply_unitary(theta, axes):
+    """Test that the diagonal apply path agrees with the dense unitary."""
+    gate = RZZGate(theta)
+    state, result = _apply_unitary(gate, axes)
+    expected = cirq.apply_unitary(
+        cirq.MatrixGate(cirq.unitary(gate)),
+        cirq.ApplyUnitaryArgs(state, np.empty_like(state), axes),
+    )
+    assert np.allclose(result, expected)
+
+
+@pytest.mark.parametrize("axis", [0, 1, 2])
+@pytest.mark.parametrize("gate", [U2Gate(0.7, -1.2), U3Gate(np.pi, 2.3, 3.0), U3Gate(0.1, 0, 0)])
+def test_single_qubit_apply_unitary(gate, axis):
+    """Test that the single-qubit apply path agrees with the dense unitary."""
+    state, result = _apply_unitary(gate, (axis,))
+    expected = np.moveaxis(np.tensordot(cirq.unitary(gate), state, axes=(1, axis)), 0, axis)
+    assert np.allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    "exponent,global_shift,expected",
+    [
+        (0.25, 0, "t q[0];\n"),
+        (-0.25, 0, "tdg q[0];\n"),
+        (0.5, 0, "s q[0];\n"),
+        (-0.5, 0, "sdg q[0];\n"),
+        (1, 0, "z q[0];\n"),
+        (0.3, 0, "p(pi*0.3) q[0];\n"),
+        (0.3, -0.5, "rz(pi*0.3) q[0];\n"),
+        (0, 0, "p(0) q[0];\n"),
+        (2, -0.5, "rz(pi*2) q[0];\n"),
+        (1 / 3, 0, "p(pi*0.3333333333) q[0];\n"),
+    ],
+)
+def test_zpow_qasm(exponent, global_shift, expected):
+    qubit = cirq.LineQubit(0)
+    args = cirq.QasmArgs(precision=10, version="2.0", qubit_id_map={qubit: "q[0]"})
+    gate = ZPowGate(exponent=exponent, global_shift=global_shift)
+    assert cirq.qasm(gate, args=args, qubits=(qubit,)) == expected
+
+
+@pytest.mark.parametrize("exponent", [0.123456789, -0.75, 3, 1e-12])
+@pytest.mark.parametrize("precision", [3, 10])
+def test_zpow_qasm_matches_qasm_args(exponent, precision):
+    """Test that directly rendered QASM matches the QasmArgs half-turns formatting."""
+    qubit = cirq.LineQubit(0)
+    args = cirq.QasmArgs(precision=precision, version="2.0", qubit_id_map={qubit: "q[0]"})
+    gate = ZPowGate(exponent=exponent)
+    expected = args.format("p({0:half_turns}) {1};\n", exponent, qubit)
+    assert cirq.qasm(gate, args=args, qubits=(qubit,)) == expected
+    assert cirq.qasm(gate, args=args, qubits=(qubit,)) == expected
+
+
+def test_rzz_layer():
+    thetas = np.array([0.3, 0, 2 * np.pi, -1.7, 4 * np.pi])
+    gates = rzz_layer(thetas)
+    assert len(gates) == len(thetas)
+    assert isinstance(gates[0], RZZGate) and isinstance(gates[3], RZZGate)
+    assert gates[1] == cirq.IdentityGate(2) and gates[4] == cirq.IdentityGate(2)
+    assert isinstance(gates[2], cirq.TwoQubitDiagonalGate)
+    for theta, gate in zip(thetas, gates):
+        assert np.allclose(cirq.unitary(gate), cirq.unitary(rzz(theta)))
+
+
+def test_u2_u3_gates_reused():
+    gate_u3 = u3(np.pi, 2.3, 3.0)
+    assert isinstance(gate_u3, U3Gate)
+    assert u3(np.float64(np.pi), 2.3, 3) is gate_u3
+    assert u3(np.pi, 2.3, 3.1) is not gate_u3
+    assert np.allclose(cirq.unitary(gate_u3), _u3_matrix(np.pi, 2.3, 3.0))
+    gate_u2 = u2(0.7, -1.2)
+    assert isinstance(gate_u2, U2Gate)
+    assert u2(0.7, -1.2) is gate_u2
+
+
+@pytest.mark.parametrize("gate", [U2Gate(0.1, 0.2), U3Gate(0.1, 0.2, 0.3), RZZGate(0.4)])
+def test_gate_copy_and_pickle(gate):
+    """Test that slotted gate attributes survive copying and pickling."""
+    for other in (copy.deepcopy(gate), pickle.loads(pickle.dumps(gate))):
+        assert np.allclose(cirq.unitary(other), cirq.unitary(gate))
+        assert cirq.circuit_diagram_info(other) == cirq.circuit_diagram_info(gate)
+
+
+@pytest.mark.parametrize("gate", [U2Gate(0.1, 0.2), U3Gate(0.1, 0.2, 0.3), RZZGate(0.4)])
+def test_has_unitary(gate):
+    assert cirq.has_unitary(gate)
+
+
+@pytest.mark.parametrize(
+    "precision,expected", [(3, "RZZ(0.25)"), (1, "RZZ(0.2)"), (None, "RZZ(0.25)")]
+)
+def test_rzz_diagram_info(precision, expected):
+    args = cirq.CircuitDiagramInfoArgs(
+        known_qubits=None,
+        known_qubit_count=2,
+        use_unicode_characters=True,
+        precision=precision,
+        label_map=None,
+    )
+    info = cirq.circuit_diagram_info(RZZGate(np.pi / 4), args)
+    assert info.wire_symbols == (expected, expected)
+
+
+def test_u3_matrices():
+    thetas = np.array([0.0, np.pi, 3.14, -0.4])
+    phis = np.array([0.0, 2.3, -np.pi, 1.1])
+    lams = np.array([0.0, 3.0, 8.0, 0.2])
+    matrices = u3_matrices(thetas, phis, lams)
+    assert matrices.shape == (4, 2, 2)
+    for matrix, params in zip(matrices, zip(thetas, phis, lams)):
+        assert np.allclose(matrix, cirq.unitary(U3Gate(*params)))
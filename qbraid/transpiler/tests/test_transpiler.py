@@ -12,6 +12,8 @@
 Unit tests for the qbraid transpiler.
 
 """
+from unittest.mock import Mock
+
 import cirq
 import numpy as np
 import pytest
@@ -40,6 +42,7 @@ from qbraid.transpiler.cirq_qasm.tests._gate_archive import create_cirq_gate
 from qbraid.transpiler.cirq_qiskit.tests._gate_archive import qiskit_gates as qiskit_gates_dict
 from qbraid.transpiler.conversions import convert_from_cirq, convert_to_cirq
 from qbraid.transpiler.exceptions import CircuitConversionError
+from qbraid.transpiler.wrappers import abc_qprogram
 
 TEST_15, UNITARY_15 = shared15_data()
 TEST_BELL, UNITARY_BELL = bell_data()
@@ -145,6 +148,16 @@ def test_transpile_program_error():
         wrapped.transpile("qiskit")
 
 
+def test_transpile_reuses_cirq_circuit(monkeypatch):
+    """Test that a wrapped program is converted to Cirq only once across transpile calls."""
+    mock_convert_to_cirq = Mock(side_effect=convert_to_cirq)
+    monkeypatch.setattr(abc_qprogram, "convert_to_cirq", mock_convert_to_cirq)
+    wrapped = circuit_wrapper(TEST_BELL["braket"]())
+    wrapped.transpile("qiskit")
+    wrapped.transpile("pytket")
+    mock_convert_to_cirq.assert_called_once()
+
+
 def shared_gates_test_data(package):
     """Returns data ``TestSharedGates``."""
     circuit = TEST_15[package]()
@@ -23,6 +23,8 @@ from qbraid.transpiler.exceptions import CircuitConversionError
 if TYPE_CHECKING:
     import qbraid
 
+_SUPPORTED_LIBS = frozenset(QPROGRAM_LIBS)
+
 
 class QuantumProgramWrapper:
     """Abstract class for qbraid program wrapper objects.
@@ -43,6 +45,7 @@ class QuantumProgramWrapper:
         self._params = []
         self._input_param_mapping = {}
         self._package = None
+        self._cirq_cache = None
 
     @property
     def program(self) -> "qbraid.QPROGRAM":
@@ -102,11 +105,16 @@ class QuantumProgramWrapper:
             :data:`~qbraid.QPROGRAM`: supported quantum program object
 
         """
-        if conversion_type == self.package:
-            return self.program
-        if conversion_type in QPROGRAM_LIBS:
+        package = self._package
+        if conversion_type == package:
+            return self._program
+        if conversion_type in _SUPPORTED_LIBS:
             try:
-                cirq_circuit, _ = convert_to_cirq(self.program)
+                # The Cirq intermediate representation is computed once per wrapper
+                # and reused for each subsequent conversion target.
+                if self._cirq_cache is None:
+                    self._cirq_cache, _ = convert_to_cirq(self.program)
+                cirq_circuit = self._cirq_cache
             except Exception as err:
                 raise CircuitConversionError(
                     "Quantum program could not be converted to a Cirq circuit. "